@@ -41,6 +41,9 @@ _CALLOUT_RE = re.compile(
     re.DOTALL,
 )
 
+# Opening tags that _CALLOUT_RE can start with (bare or preprocessor-wrapped)
+_CALLOUT_PREFIXES = ("<callout", '<div data-notion="callout">')
+
 # Block: <details><summary>title</summary>content</details>
 _DETAILS_RE = re.compile(
     r"<details>\s*<summary>(.*?)</summary>(.*?)</details>",
@@ -57,8 +60,6 @@ _SPAN_OPEN_RE = re.compile(
     r"\s*>",
 )
 
-_SPAN_CLOSE_RE = re.compile(r"</span>")
-
 # Emoji detection: first character(s) of callout content
 _EMOJI_RE = re.compile(
     r"^([\U0001f300-\U0001faff\U00002702-\U000027b0\U0000fe0f"
@@ -81,6 +82,12 @@ class InlineHTMLResult:
     color: str = ""
 
 
+# Attribute-free results are immutable, so every match can share one instance.
+_BR_RESULT = InlineHTMLResult(is_br=True)
+_SPAN_CLOSE_RESULT = InlineHTMLResult(is_span_close=True)
+_SPAN_UNDERLINE_RESULT = InlineHTMLResult(is_span_open=True, underline=True)
+
+
 # ── Block-level HTML parsing ──────────────────────────────────────────────
 
 
@@ -96,25 +103,33 @@ def parse_block_html(raw: str) -> list[NotionBlock] | None:
     """
     stripped = raw.strip()
 
+    # Each pattern is anchored on a fixed opening tag, so a prefix check
+    # selects the single regex that can match.
+
     # ── <aside>...</aside> → callout ──────────────────────────────────
-    m = _ASIDE_RE.match(stripped)
-    if m:
-        return _build_callout_from_content(m.group(1).strip())
+    if stripped.startswith("<aside>"):
+        m = _ASIDE_RE.match(stripped)
+        if m:
+            return _build_callout_from_content(m.group(1).strip())
+        return None
 
     # ── <callout ...>...</callout> → callout ──────────────────────────
-    m = _CALLOUT_RE.match(stripped)
-    if m:
-        icon = (m.group(1) or "").strip()
-        color = (m.group(2) or "").strip()
-        content = (m.group(3) or "").strip()
-        return _build_callout(content, icon=icon, color=color)
+    if stripped.startswith(_CALLOUT_PREFIXES):
+        m = _CALLOUT_RE.match(stripped)
+        if m:
+            icon = (m.group(1) or "").strip()
+            color = (m.group(2) or "").strip()
+            content = (m.group(3) or "").strip()
+            return _build_callout(content, icon=icon, color=color)
+        return None
 
     # ── <details><summary>...</summary>...</details> → toggle ─────────
-    m = _DETAILS_RE.match(stripped)
-    if m:
-        title = m.group(1).strip()
-        body = m.group(2).strip()
-        return _build_toggle(title, body)
+    if stripped.startswith("<details>"):
+        m = _DETAILS_RE.match(stripped)
+        if m:
+            title = m.group(1).strip()
+            body = m.group(2).strip()
+            return _build_toggle(title, body)
 
     return None
 
@@ -178,22 +193,26 @@ def parse_inline_html(raw: str) -> InlineHTMLResult | None:
     """
     stripped = raw.strip()
 
+    # Dispatch on the tag prefix so at most one regex runs per tag.
+
+    # ── </span> ──────────────────────────────────────────────────────
+    if stripped == "</span>":
+        return _SPAN_CLOSE_RESULT
+
     # ── <br> / <br/> ─────────────────────────────────────────────────
-    if _BR_RE.fullmatch(stripped):
-        return InlineHTMLResult(is_br=True)
+    if stripped.startswith("<br"):
+        return _BR_RESULT if _BR_RE.fullmatch(stripped) else None
 
     # ── <span underline="true"> or <span color="..."> ────────────────
-    m = _SPAN_OPEN_RE.fullmatch(stripped)
-    if m:
+    if stripped.startswith("<span"):
+        m = _SPAN_OPEN_RE.fullmatch(stripped)
+        if m is None:
+            return None
         color_val = m.group(1) or ""
         if color_val:
             return InlineHTMLResult(is_span_open=True, color=color_val)
         # No color group means it matched underline="true"
-        return InlineHTMLResult(is_span_open=True, underline=True)
-
-    # ── </span> ──────────────────────────────────────────────────────
-    if _SPAN_CLOSE_RE.fullmatch(stripped):
-        return InlineHTMLResult(is_span_close=True)
+        return _SPAN_UNDERLINE_RESULT
 
     return None
 
@@ -229,12 +248,20 @@ def preprocess_notion_html(markdown: str) -> str:
     ``<div>`` with a ``data-notion`` attribute so mistune treats it as a
     block-level HTML element, then ``parse_block_html`` unwraps it.
     """
+    # Each substitution is guarded by a substring check so documents without
+    # Notion HTML (the common case) skip the regex scans entirely.
+    result = markdown
+
     # Collapse standard HTML block tags onto a single line
-    result = _ASIDE_BLOCK_RE.sub(_collapse_html_block, markdown)
-    result = _DETAILS_BLOCK_RE.sub(_collapse_html_block, result)
+    if "<aside>" in result:
+        result = _ASIDE_BLOCK_RE.sub(_collapse_html_block, result)
+    if "<details>" in result:
+        result = _DETAILS_BLOCK_RE.sub(_collapse_html_block, result)
 
     # Wrap <callout> in a <div data-notion="callout"> so mistune sees it as block HTML
-    return _CALLOUT_BLOCK_RE.sub(_wrap_callout_block, result)
+    if "<callout" in result:
+        result = _CALLOUT_BLOCK_RE.sub(_wrap_callout_block, result)
+    return result
 
 
 def _collapse_html_block(m: re.Match[str]) -> str:
@@ -126,9 +126,12 @@ def _make_text(
     else:
         text_obj = {"type": "text", "text": {"content": content}}
 
-    annotations = _to_annotations(style)
-    if annotations:
-        text_obj["annotations"] = annotations
+    # Unstyled text is the common case and always shares _DEFAULT_STYLE, so an
+    # identity check skips building (and discarding) an empty annotations dict.
+    if style is not _DEFAULT_STYLE:
+        annotations = _to_annotations(style)
+        if annotations:
+            text_obj["annotations"] = annotations
     return text_obj
 
 
@@ -162,7 +165,8 @@ def parse_inline(
     result: list[RichText] = []
 
     for token in children:
-        ttype = _tok_type(token)
+        # Inlined _tok_type(): this loop runs once per inline token.
+        ttype = token.get("type", "")
 
         # ── Leaf: plain text ───────────────────────────────────────────
         if ttype == "text":
@@ -293,7 +297,7 @@ def _process_span(
     Appends rich-text items to *out* and returns the unconsumed tail.
     """
     for i, token in enumerate(tokens):
-        ttype = _tok_type(token)
+        ttype = token.get("type", "")
 
         if ttype in ("inline_html", "html"):
             raw = _tok_raw(token)
@@ -9,8 +9,10 @@ Public entry point: :func:`to_markdown`.
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, cast
+import functools
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, cast
 
 from notion_markdown._rich_text import render_rich_text
 
@@ -51,41 +53,82 @@ def render_blocks(blocks: list[Any], indent: int = 0) -> str:
     str
         Markdown text with a trailing newline.
     """
-    parts: list[str] = []
-    prev_type = ""
-
-    for block in blocks:
-        d: dict[str, Any] = cast("dict[str, Any]", block)
-        block_type: str = d.get("type", "")
-        data: dict[str, Any] = d.get(block_type, {})
-
-        # Insert blank line between different block types (but not between
-        # consecutive list items of the same type).
-        if parts and not _is_same_list_group(prev_type, block_type):
-            parts.append("")
-
-        rendered = _render_block(block_type, data, indent)
-        if rendered is not None:
-            parts.append(rendered)
-        prev_type = block_type
-
+    get_renderer = _RENDERERS.get
+    get_nesting = _NESTED_CHILDREN.get
+
+    # Nested children are rendered from an explicit stack of frames instead of
+    # by recursion, so document depth is not bounded by the recursion limit.
+    frame = _Frame(iter(blocks), indent)
+    stack: list[tuple[_Frame, str, _Nesting]] = []
+
+    while True:
+        for block in frame.blocks:
+            # Blocks are typed Any, so no cast() call is needed per block; the
+            # type and its payload are each looked up exactly once.
+            block_type: str = block.get("type", "")
+            data: dict[str, Any] = block.get(block_type, {})
+
+            # Insert blank line between different block types (but not between
+            # consecutive list items of the same type).
+            if frame.parts and (block_type != frame.prev_type or block_type not in _LIST_TYPES):
+                frame.parts.append("")
+            frame.prev_type = block_type
+
+            # Unknown block types have no renderer and produce no output.
+            renderer = get_renderer(block_type)
+            if renderer is None:
+                continue
+            rendered = renderer(data, frame.indent)
+
+            nesting = get_nesting(block_type)
+            children = _get_children(data) if nesting is not None else None
+            if nesting is not None and children:
+                # Suspend this frame and render the children first.
+                stack.append((frame, rendered, nesting))
+                frame = _Frame(iter(children), nesting.child_indent(frame.indent))
+                break
+            frame.parts.append(rendered)
+        else:
+            text = _join_parts(frame.parts)
+            if not stack:
+                return text
+            parent, rendered, nesting = stack.pop()
+            parent.parts.append(nesting.attach(rendered, text, parent.indent))
+            frame = parent
+
+
+def _join_parts(parts: list[str]) -> str:
+    """Join rendered blocks with newlines, ensuring a trailing newline."""
     text = "\n".join(parts)
     if text and not text.endswith("\n"):
         text += "\n"
     return text
 
 
+@dataclass(slots=True)
+class _Frame:
+    """One partially rendered list of sibling blocks on the render stack."""
+
+    blocks: Iterator[Any]
+    indent: int
+    parts: list[str] = field(default_factory=list)
+    prev_type: str = ""
+
+
 # ── Helpers ────────────────────────────────────────────────────────────────
 
+# Consecutive blocks of one of these types form a single list (no blank line)
 _LIST_TYPES = frozenset({"bulleted_list_item", "numbered_list_item", "to_do"})
 
 
-def _is_same_list_group(prev: str, cur: str) -> bool:
-    """True when two adjacent blocks should NOT get a blank line between them."""
-    return prev == cur and cur in _LIST_TYPES
+# Indent prefixes up to eight levels of 4-space list nesting; deeper indents
+# fall back to building the string.
+_INDENTS: tuple[str, ...] = tuple(" " * n for n in range(33))
 
 
 def _indent_str(indent: int) -> str:
+    if indent < len(_INDENTS):
+        return _INDENTS[indent]
     return " " * indent
 
 
@@ -99,62 +142,40 @@ def _get_children(data: dict[str, Any]) -> list[Any]:
 
 # ── Block dispatcher ──────────────────────────────────────────────────────
 
+# Every renderer takes the block's type-keyed payload and the indent level.
+# render_blocks() looks renderers up in _RENDERERS (bottom of the module).
 _BlockRenderer = Callable[[dict[str, Any], int], str]
 
 
-def _render_block(
-    block_type: str,
-    data: dict[str, Any],
-    indent: int,
-) -> str | None:
-    """Dispatch to the correct renderer for *block_type*."""
-    renderer = _RENDERERS.get(block_type)
-    if renderer is not None:
-        return renderer(data, indent)
-    return None
-
-
 # ── Block renderers ───────────────────────────────────────────────────────
 
+# Markers (fences, ``<aside>``, ``> `` …) stay inline as literals: they are
+# code-object constants, so nothing is allocated for them per block.
+
 
 def _render_paragraph(data: dict[str, Any], indent: int) -> str:
     prefix = _indent_str(indent)
     return prefix + render_rich_text(_get_rich_text(data))
 
 
-def _render_heading_1(data: dict[str, Any], indent: int) -> str:
-    prefix = _indent_str(indent)
-    return f"{prefix}# {render_rich_text(_get_rich_text(data))}"
-
+# Block type → Markdown marker (including the trailing space) for blocks
+# rendered as ``<indent><marker><rich text>``.
+_PREFIX_MARKERS: dict[str, str] = {
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "- ",
+    "numbered_list_item": "1. ",
+}
 
-def _render_heading_2(data: dict[str, Any], indent: int) -> str:
-    prefix = _indent_str(indent)
-    return f"{prefix}## {render_rich_text(_get_rich_text(data))}"
 
+def _prefixed_renderer(marker: str) -> _BlockRenderer:
+    """Build the renderer for blocks written with *marker* before their text."""
 
-def _render_heading_3(data: dict[str, Any], indent: int) -> str:
-    prefix = _indent_str(indent)
-    return f"{prefix}### {render_rich_text(_get_rich_text(data))}"
+    def _render_prefixed(data: dict[str, Any], indent: int) -> str:
+        return f"{_indent_str(indent)}{marker}{render_rich_text(_get_rich_text(data))}"
 
-
-def _render_bulleted_list_item(data: dict[str, Any], indent: int) -> str:
-    prefix = _indent_str(indent)
-    text = render_rich_text(_get_rich_text(data))
-    result = f"{prefix}- {text}"
-    children = _get_children(data)
-    if children:
-        result += "\n" + render_blocks(children, indent=indent + 4).rstrip("\n")
-    return result
-
-
-def _render_numbered_list_item(data: dict[str, Any], indent: int) -> str:
-    prefix = _indent_str(indent)
-    text = render_rich_text(_get_rich_text(data))
-    result = f"{prefix}1. {text}"
-    children = _get_children(data)
-    if children:
-        result += "\n" + render_blocks(children, indent=indent + 4).rstrip("\n")
-    return result
+    return _render_prefixed
 
 
 def _render_to_do(data: dict[str, Any], indent: int) -> str:
@@ -162,11 +183,7 @@ def _render_to_do(data: dict[str, Any], indent: int) -> str:
     checked: bool = data.get("checked", False)
     marker = "[x]" if checked else "[ ]"
     text = render_rich_text(_get_rich_text(data))
-    result = f"{prefix}- {marker} {text}"
-    children = _get_children(data)
-    if children:
-        result += "\n" + render_blocks(children, indent=indent + 4).rstrip("\n")
-    return result
+    return f"{prefix}- {marker} {text}"
 
 
 def _render_code(data: dict[str, Any], indent: int) -> str:
@@ -181,14 +198,10 @@ def _render_code(data: dict[str, Any], indent: int) -> str:
 def _render_quote(data: dict[str, Any], indent: int) -> str:
     prefix = _indent_str(indent)
     text = render_rich_text(_get_rich_text(data))
-    lines = text.splitlines() if text else [""]
-    result = "\n".join(f"{prefix}> {line}" for line in lines)
-    children = _get_children(data)
-    if children:
-        child_md = render_blocks(children, indent=0).rstrip("\n")
-        for line in child_md.splitlines():
-            result += f"\n{prefix}> {line}"
-    return result
+    # splitlines() (not str.replace) so every line-boundary character starts a
+    # new quoted line; the marker is then joined in with one C-level call.
+    marker = f"{prefix}> "
+    return marker + ("\n" + marker).join(text.splitlines()) if text else marker
 
 
 def _render_callout(data: dict[str, Any], indent: int) -> str:
@@ -228,15 +241,19 @@ def _render_table(data: dict[str, Any], indent: int) -> str:
     lines: list[str] = []
     for i, row in enumerate(rows):
         cells: list[list[Any]] = row.get("table_row", {}).get("cells", [])
-        cell_strs = [render_rich_text(cell) for cell in cells]
-        line = f"{prefix}| " + " | ".join(cell_strs) + " |"
-        lines.append(line)
+        row_md = " | ".join([render_rich_text(cell) for cell in cells])
+        lines.append(f"{prefix}| {row_md} |")
         if i == 0 and has_header:
-            sep = f"{prefix}|" + "|".join(" --- " for _ in cells) + "|"
-            lines.append(sep)
+            lines.append(prefix + _table_separator(len(cells)))
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=64)
+def _table_separator(width: int) -> str:
+    """Return the ``| --- | --- |`` header separator for a *width*-column table."""
+    return "|" + "|".join([" --- "] * width) + "|"
+
+
 def _render_image(data: dict[str, Any], indent: int) -> str:
     prefix = _indent_str(indent)
     external: dict[str, str] = data.get("external", {})
@@ -271,15 +288,49 @@ def _render_video(data: dict[str, Any], indent: int) -> str:
     return f"{prefix}![video]({url})"
 
 
+# ── Nested children ───────────────────────────────────────────────────────
+
+
+class _Nesting(NamedTuple):
+    """How a container block lays out its rendered children."""
+
+    # Indent to render the children at, given the container's indent
+    child_indent: Callable[[int], int]
+    # Combine the container's own Markdown, its rendered children and its indent
+    attach: Callable[[str, str, int], str]
+
+
+def _attach_list_children(rendered: str, children_md: str, _indent: int) -> str:
+    return rendered + "\n" + children_md.rstrip("\n")
+
+
+def _attach_quote_children(rendered: str, children_md: str, indent: int) -> str:
+    lines = children_md.rstrip("\n").splitlines()
+    if not lines:
+        return rendered
+    # Quote every child line in one join instead of growing a string per line.
+    separator = f"\n{_indent_str(indent)}> "
+    return rendered + separator + separator.join(lines)
+
+
+_LIST_NESTING = _Nesting(lambda indent: indent + 4, _attach_list_children)
+
+# Block types whose ``children`` are rendered as nested Markdown blocks.
+# (Toggles render only their first child's text, and table rows are cells.)
+_NESTED_CHILDREN: dict[str, _Nesting] = {
+    "bulleted_list_item": _LIST_NESTING,
+    "numbered_list_item": _LIST_NESTING,
+    "to_do": _LIST_NESTING,
+    # Quote children are rendered flush-left, then every line is quoted
+    "quote": _Nesting(lambda _indent: 0, _attach_quote_children),
+}
+
+
 # ── Renderer registry ─────────────────────────────────────────────────────
 
 _RENDERERS: dict[str, _BlockRenderer] = {
     "paragraph": _render_paragraph,
-    "heading_1": _render_heading_1,
-    "heading_2": _render_heading_2,
-    "heading_3": _render_heading_3,
-    "bulleted_list_item": _render_bulleted_list_item,
-    "numbered_list_item": _render_numbered_list_item,
+    **{btype: _prefixed_renderer(marker) for btype, marker in _PREFIX_MARKERS.items()},
     "to_do": _render_to_do,
     "code": _render_code,
     "quote": _render_quote,
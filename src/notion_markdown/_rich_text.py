@@ -13,6 +13,30 @@ if TYPE_CHECKING:
     from notion_markdown._types import RichText, RichTextAnnotations
 
 
+# ── Emphasis wrappers ─────────────────────────────────────────────────────
+
+# Bit flags for the marker-based annotations; a combination indexes _WRAP.
+_STRIKE = 1
+_BOLD = 2
+_ITALIC = 4
+
+
+def _wrapper(mask: int) -> tuple[str, str]:
+    """Build the (prefix, suffix) markers for an annotation bitmask."""
+    bold = mask & _BOLD
+    italic = mask & _ITALIC
+    emphasis = "***" if bold and italic else "**" if bold else "*" if italic else ""
+    strike = "~~" if mask & _STRIKE else ""
+    # Strikethrough sits inside bold/italic: **~~text~~**
+    return emphasis + strike, strike + emphasis
+
+
+_WRAP: tuple[tuple[str, str], ...] = tuple(_wrapper(mask) for mask in range(8))
+
+# Shared read-only default for items without annotations.
+_NO_ANNOTATIONS: RichTextAnnotations = {}
+
+
 def render_rich_text(items: list[RichText]) -> str:
     """Convert a list of Notion rich-text items to a Markdown string.
 
@@ -26,13 +50,27 @@ def render_rich_text(items: list[RichText]) -> str:
     str
         The Markdown representation of the combined rich-text.
     """
-    return "".join(_render_one(item) for item in items)
-
-
-def _render_one(item: RichText) -> str:
-    """Render a single rich-text item to Markdown."""
+    # Empty rich text (common for blank Notion paragraphs) needs no work
+    if not items:
+        return ""
+    # Long paragraphs hold hundreds of spans: appending to a list and joining
+    # once is cheaper than writing each piece to an io.StringIO buffer.
+    parts: list[str] = []
     # Cast to Any to work around TypedDict union access limitations
-    d: dict[str, Any] = cast("dict[str, Any]", item)
+    for d in cast("list[dict[str, Any]]", items):
+        # Fast path: unannotated, unlinked text (the bulk of most documents)
+        # is emitted as-is without going through _apply_formatting().
+        if not d.get("annotations") and d.get("type") != "equation":
+            text_obj: dict[str, Any] = d.get("text", {})
+            if not text_obj.get("link"):
+                parts.append(text_obj.get("content", ""))
+                continue
+        parts.append(_render_one(d))
+    return "".join(parts)
+
+
+def _render_one(d: dict[str, Any]) -> str:
+    """Render a single rich-text item to Markdown."""
     item_type: str = d.get("type", "text")
 
     if item_type == "equation":
@@ -47,7 +85,7 @@ def _render_one(item: RichText) -> str:
     if not content:
         return ""
 
-    annotations: RichTextAnnotations = d.get("annotations", {})
+    annotations: RichTextAnnotations = d.get("annotations") or _NO_ANNOTATIONS
     link_obj = text_obj.get("link")
     link_url: str = ""
     if isinstance(link_obj, dict):
@@ -63,16 +101,20 @@ def _apply_formatting(
 ) -> str:
     """Wrap *content* in the appropriate Markdown markers."""
     result = content
+    # Annotation dicts from to_notion() omit falsy keys, so lookups go through
+    # one bound .get rather than direct indexing (which would raise KeyError);
+    # color keeps the typed TypedDict lookup.
+    get = annotations.get
 
     # Code must be applied first and is mutually exclusive with other markers
-    if annotations.get("code"):
+    if get("code"):
         result = f"`{result}`"
         if link_url:
             result = f"[{result}]({link_url})"
         return result
 
     # Underline → HTML span (no standard MD equivalent)
-    if annotations.get("underline"):
+    if get("underline"):
         result = f'<span underline="true">{result}</span>'
 
     # Color → HTML span
@@ -80,19 +122,16 @@ def _apply_formatting(
     if color:
         result = f'<span color="{color}">{result}</span>'
 
-    # Strikethrough wraps
-    if annotations.get("strikethrough"):
-        result = f"~~{result}~~"
-
-    # Bold + italic combine as ***…***
-    bold = annotations.get("bold", False)
-    italic = annotations.get("italic", False)
-    if bold and italic:
-        result = f"***{result}***"
-    elif bold:
-        result = f"**{result}**"
-    elif italic:
-        result = f"*{result}*"
+    # Strikethrough, bold and italic markers come from one table lookup;
+    # bold + italic combine as ***…***
+    mask = (
+        (_STRIKE if get("strikethrough") else 0)
+        | (_BOLD if get("bold") else 0)
+        | (_ITALIC if get("italic") else 0)
+    )
+    if mask:
+        prefix, suffix = _WRAP[mask]
+        result = f"{prefix}{result}{suffix}"
 
     # Link wraps everything
     if link_url:
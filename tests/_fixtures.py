@@ -0,0 +1,45 @@
+"""Markdown inputs shared between test modules."""
+
+from __future__ import annotations
+
+# A document exercising every block type, for the end-to-end tests and benchmarks.
+FULL_MARKDOWN = """\
+# Project Status
+
+This is the **summary** of Q3 results.
+
+## Key Metrics
+
+- Revenue: *$1.2M*
+- Users: `50,000`
+- ~~Target missed~~
+
+### Action Items
+
+1. Review budget
+2. Update roadmap
+3. Schedule all-hands
+
+- [x] Finalize report
+- [ ] Send to stakeholders
+
+> Important: This data is **confidential**.
+
+```python
+def calculate_growth(current, previous):
+    return (current - previous) / previous * 100
+```
+
+| Metric | Q2 | Q3 |
+|--------|-----|-----|
+| Revenue | 1.0 | 1.2 |
+| Users | 40k | 50k |
+
+---
+
+![chart](https://example.com/chart.png)
+
+$$
+\\Delta = \\frac{Q3 - Q2}{Q2} \\times 100
+$$
+"""
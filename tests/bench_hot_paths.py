@@ -0,0 +1,60 @@
+"""Benchmarks for the conversion hot paths.
+
+Not collected by the default test run (the file name does not match
+``test_*.py``).  Requires ``pytest-benchmark``::
+
+    uv pip install pytest-benchmark
+    pytest tests/bench_hot_paths.py --benchmark-autosave
+    pytest tests/bench_hot_paths.py --benchmark-compare --benchmark-compare-fail=mean:100%
+
+The second command fails if any benchmark's mean is more than 2x the saved
+baseline.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from notion_markdown import to_markdown, to_notion
+from notion_markdown._html import parse_inline_html, preprocess_notion_html
+from tests._fixtures import FULL_MARKDOWN
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def full_blocks() -> list:
+    return to_notion(FULL_MARKDOWN)
+
+
+def test_full_doc_parse(benchmark) -> None:
+    benchmark(to_notion, FULL_MARKDOWN)
+
+
+def test_full_doc_render(benchmark, full_blocks) -> None:
+    benchmark(to_markdown, full_blocks)
+
+
+def test_preprocess_no_html(benchmark) -> None:
+    benchmark(preprocess_notion_html, FULL_MARKDOWN)
+
+
+@pytest.mark.parametrize("tag", ["<br>", "</span>", '<span color="red">', "<em>"])
+def test_inline_html_dispatch(benchmark, tag) -> None:
+    benchmark(parse_inline_html, tag)
+
+
+# A large table of repeated, formatted cells — the case a rich-text render
+# cache would target.
+_FORMATTED_TABLE_MARKDOWN = "| h1 | h2 | h3 |\n| --- | --- | --- |\n" + "\n".join(
+    ["| **A** | *b* | [l](https://example.com) |"] * 500
+)
+
+
+@pytest.fixture(scope="module")
+def formatted_table_blocks() -> list:
+    return to_notion(_FORMATTED_TABLE_MARKDOWN)
+
+
+def test_formatted_table_render(benchmark, formatted_table_blocks) -> None:
+    benchmark(to_markdown, formatted_table_blocks)
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import warnings
 
+import pytest
+
 from notion_markdown import convert, to_markdown, to_notion
+from tests._fixtures import FULL_MARKDOWN
 
 
 class TestToNotionAPI:
@@ -39,51 +42,21 @@ class TestConvertDeprecated:
 
 
 class TestFullDocument:
-    MARKDOWN = """\
-# Project Status
-
-This is the **summary** of Q3 results.
-
-## Key Metrics
-
-- Revenue: *$1.2M*
-- Users: `50,000`
-- ~~Target missed~~
-
-### Action Items
-
-1. Review budget
-2. Update roadmap
-3. Schedule all-hands
-
-- [x] Finalize report
-- [ ] Send to stakeholders
-
-> Important: This data is **confidential**.
-
-```python
-def calculate_growth(current, previous):
-    return (current - previous) / previous * 100
-```
-
-| Metric | Q2 | Q3 |
-|--------|-----|-----|
-| Revenue | 1.0 | 1.2 |
-| Users | 40k | 50k |
-
----
-
-![chart](https://example.com/chart.png)
-
-$$
-\\Delta = \\frac{Q3 - Q2}{Q2} \\times 100
-$$
-"""
-
-    def test_full_document_types(self) -> None:
-        blocks = to_notion(self.MARKDOWN)
-        types = [b["type"] for b in blocks]
-        expected = [
+    @pytest.fixture(scope="class")
+    @classmethod
+    def blocks(cls) -> list:
+        return to_notion(FULL_MARKDOWN)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def by_type(cls, blocks) -> dict[str, list]:
+        grouped: dict[str, list] = {}
+        for block in blocks:
+            grouped.setdefault(block["type"], []).append(block)
+        return grouped
+
+    def test_full_document_types(self, by_type) -> None:
+        expected = {
             "heading_1",
             "heading_2",
             "heading_3",
@@ -97,51 +70,48 @@ $$
             "divider",
             "image",
             "equation",
-        ]
-        for t in expected:
-            assert t in types, f"Missing block type: {t}"
+        }
+        missing = expected - by_type.keys()
+        assert not missing, f"Missing block types: {sorted(missing)}"
 
-    def test_full_document_block_count(self) -> None:
-        assert len(to_notion(self.MARKDOWN)) >= 15
+    def test_full_document_block_count(self, blocks) -> None:
+        assert len(blocks) >= 15
 
-    def test_code_block_language(self) -> None:
-        code_blocks = [b for b in to_notion(self.MARKDOWN) if b["type"] == "code"]
-        assert code_blocks[0]["code"]["language"] == "python"
+    def test_code_block_language(self, by_type) -> None:
+        assert by_type["code"][0]["code"]["language"] == "python"
 
-    def test_table_structure(self) -> None:
-        tables = [b for b in to_notion(self.MARKDOWN) if b["type"] == "table"]
-        table = tables[0]["table"]
+    def test_table_structure(self, by_type) -> None:
+        table = by_type["table"][0]["table"]
         assert table["table_width"] == 3
         assert table["has_column_header"] is True
         assert len(table["children"]) == 3
 
-    def test_todo_states(self) -> None:
-        todos = [b for b in to_notion(self.MARKDOWN) if b["type"] == "to_do"]
+    def test_todo_states(self, by_type) -> None:
+        todos = by_type["to_do"]
         assert len(todos) == 2
         assert sum(1 for t in todos if t["to_do"]["checked"]) == 1
         assert sum(1 for t in todos if not t["to_do"]["checked"]) == 1
 
-    def test_image_url(self) -> None:
-        images = [b for b in to_notion(self.MARKDOWN) if b["type"] == "image"]
-        assert images[0]["image"]["external"]["url"] == "https://example.com/chart.png"
-
-    def test_strikethrough_in_list(self) -> None:
-        bullet_items = [b for b in to_notion(self.MARKDOWN) if b["type"] == "bulleted_list_item"]
-        found = any(
-            rt.get("annotations", {}).get("strikethrough")
-            for item in bullet_items
-            for rt in item["bulleted_list_item"]["rich_text"]
-        )
-        assert found
-
-    def test_inline_code_in_list(self) -> None:
-        bullet_items = [b for b in to_notion(self.MARKDOWN) if b["type"] == "bulleted_list_item"]
-        found = any(
-            rt.get("annotations", {}).get("code")
-            for item in bullet_items
-            for rt in item["bulleted_list_item"]["rich_text"]
-        )
-        assert found
+    def test_image_url(self, by_type) -> None:
+        image = by_type["image"][0]["image"]
+        assert image["external"]["url"] == "https://example.com/chart.png"
+
+    def test_strikethrough_in_list(self, by_type) -> None:
+        assert "strikethrough" in _bullet_annotations(by_type)
+
+    def test_inline_code_in_list(self, by_type) -> None:
+        assert "code" in _bullet_annotations(by_type)
+
+
+def _bullet_annotations(by_type: dict[str, list]) -> set[str]:
+    """Names of the annotations set on any bulleted list item's rich text."""
+    return {
+        name
+        for item in by_type["bulleted_list_item"]
+        for rt in item["bulleted_list_item"]["rich_text"]
+        for name, value in rt.get("annotations", {}).items()
+        if value
+    }
 
 
 class TestNotionAPICompatibility:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from notion_markdown._html import (
     InlineHTMLResult,
     parse_block_html,
@@ -13,18 +15,27 @@ from notion_markdown._html import (
 
 
 class TestAsideCallout:
-    def test_aside_with_emoji(self) -> None:
-        blocks = parse_block_html("<aside>\n🤝 For any question.\n</aside>")
+    @pytest.mark.parametrize(
+        ("raw", "emoji", "text"),
+        [
+            ("<aside>\n🤝 For any question.\n</aside>", "🤝", "For any question."),
+            ("<aside>💡 Tip: use this feature.</aside>", "💡", "Tip: use this feature."),
+        ],
+        ids=["with_emoji", "single_line"],
+    )
+    def test_aside_with_emoji(self, raw, emoji, text) -> None:
+        blocks = parse_block_html(raw)
         assert blocks is not None
         assert len(blocks) == 1
         assert blocks[0]["type"] == "callout"
         callout = blocks[0]["callout"]
-        assert callout["icon"] == {"emoji": "🤝"}
-        assert callout["rich_text"][0]["text"]["content"] == "For any question."
+        assert callout["icon"] == {"emoji": emoji}
+        assert callout["rich_text"][0]["text"]["content"] == text
 
     def test_aside_without_emoji(self) -> None:
         blocks = parse_block_html("<aside>Plain callout text</aside>")
         assert blocks is not None
+        assert len(blocks) == 1
         assert blocks[0]["type"] == "callout"
         callout = blocks[0]["callout"]
         assert "icon" not in callout
@@ -33,13 +44,11 @@ class TestAsideCallout:
     def test_aside_empty(self) -> None:
         blocks = parse_block_html("<aside></aside>")
         assert blocks is not None
+        assert len(blocks) == 1
         assert blocks[0]["type"] == "callout"
-        assert blocks[0]["callout"]["rich_text"] == []
-
-    def test_aside_single_line(self) -> None:
-        blocks = parse_block_html("<aside>💡 Tip: use this feature.</aside>")
-        assert blocks is not None
-        assert blocks[0]["callout"]["icon"] == {"emoji": "💡"}
+        callout = blocks[0]["callout"]
+        assert "icon" not in callout
+        assert callout["rich_text"] == []
 
     def test_aside_multiline(self) -> None:
         raw = "<aside>\n⭐ Line one\nLine two\n</aside>"
@@ -54,58 +63,70 @@ class TestAsideCallout:
 
 class TestCalloutTag:
     def test_callout_with_icon_and_color(self) -> None:
-        raw = '<callout icon="🔥" color="red_bg">Hot tip!</callout>'
-        blocks = parse_block_html(raw)
+        blocks = parse_block_html('<callout icon="🔥" color="red_bg">Hot tip!</callout>')
         assert blocks is not None
+        assert blocks[0]["type"] == "callout"
         callout = blocks[0]["callout"]
         assert callout["icon"] == {"emoji": "🔥"}
         assert callout["color"] == "red_bg"
         assert callout["rich_text"][0]["text"]["content"] == "Hot tip!"
 
     def test_callout_icon_only(self) -> None:
-        raw = '<callout icon="📝">Note text</callout>'
-        blocks = parse_block_html(raw)
+        blocks = parse_block_html('<callout icon="📝">Note text</callout>')
         assert blocks is not None
+        assert blocks[0]["type"] == "callout"
         callout = blocks[0]["callout"]
         assert callout["icon"] == {"emoji": "📝"}
         assert "color" not in callout
+        assert callout["rich_text"][0]["text"]["content"] == "Note text"
 
     def test_callout_no_attrs(self) -> None:
-        raw = "<callout>Simple callout</callout>"
-        # This may or may not match depending on regex; if icon is required, skip
-        # The regex allows optional icon/color, so it should match
-        blocks = parse_block_html(raw)
-        if blocks is not None:
-            assert blocks[0]["type"] == "callout"
+        blocks = parse_block_html("<callout>Simple callout</callout>")
+        assert blocks is not None
+        assert blocks[0]["type"] == "callout"
+        callout = blocks[0]["callout"]
+        assert "icon" not in callout
+        assert "color" not in callout
+        assert callout["rich_text"][0]["text"]["content"] == "Simple callout"
 
 
 # ── parse_block_html: <details> → toggle ──────────────────────────────────
 
 
 class TestDetailsToggle:
-    def test_details_with_summary_and_body(self) -> None:
-        raw = "<details><summary>Click to expand</summary>Hidden content</details>"
+    @pytest.mark.parametrize(
+        ("raw", "title", "body"),
+        [
+            (
+                "<details><summary>Click to expand</summary>Hidden content</details>",
+                "Click to expand",
+                "Hidden content",
+            ),
+            (
+                "<details>\n<summary>Expand</summary>\nLine 1\nLine 2\n</details>",
+                "Expand",
+                "Line 1\nLine 2",
+            ),
+        ],
+        ids=["summary_and_body", "multiline"],
+    )
+    def test_details_with_body(self, raw, title, body) -> None:
         blocks = parse_block_html(raw)
         assert blocks is not None
         assert blocks[0]["type"] == "toggle"
         toggle = blocks[0]["toggle"]
-        assert toggle["rich_text"][0]["text"]["content"] == "Click to expand"
+        assert toggle["rich_text"][0]["text"]["content"] == title
         assert toggle["children"][0]["type"] == "paragraph"
         body_text = toggle["children"][0]["paragraph"]["rich_text"][0]["text"]["content"]
-        assert body_text == "Hidden content"
+        assert body_text == body
 
     def test_details_empty_body(self) -> None:
-        raw = "<details><summary>Title only</summary></details>"
-        blocks = parse_block_html(raw)
-        assert blocks is not None
-        assert blocks[0]["type"] == "toggle"
-        assert "children" not in blocks[0]["toggle"]
-
-    def test_details_multiline(self) -> None:
-        raw = "<details>\n<summary>Expand</summary>\nLine 1\nLine 2\n</details>"
-        blocks = parse_block_html(raw)
+        blocks = parse_block_html("<details><summary>Title only</summary></details>")
         assert blocks is not None
         assert blocks[0]["type"] == "toggle"
+        toggle = blocks[0]["toggle"]
+        assert toggle["rich_text"][0]["text"]["content"] == "Title only"
+        assert "children" not in toggle
 
 
 # ── parse_block_html: unrecognized ────────────────────────────────────────
@@ -121,6 +142,11 @@ class TestUnrecognizedBlockHTML:
     def test_plain_text(self) -> None:
         assert parse_block_html("just text") is None
 
+    def test_unclosed_tags(self) -> None:
+        assert parse_block_html("<aside>never closed") is None
+        assert parse_block_html("<callout>never closed") is None
+        assert parse_block_html("<details>no summary</details>") is None
+
 
 # ── parse_inline_html ─────────────────────────────────────────────────────
 
@@ -181,6 +207,12 @@ class TestInlineHTMLUnrecognized:
     def test_random_tag(self) -> None:
         assert parse_inline_html("<em>") is None
 
+    def test_br_prefixed_tag(self) -> None:
+        assert parse_inline_html("<brx>") is None
+
+    def test_span_without_notion_attrs(self) -> None:
+        assert parse_inline_html('<span class="x">') is None
+
     def test_plain_text(self) -> None:
         assert parse_inline_html("text") is None
 
@@ -200,6 +232,13 @@ class TestInlineHTMLResult:
         assert r.underline is False
         assert r.color == ""
 
+    def test_slotted(self) -> None:
+        assert not hasattr(InlineHTMLResult(), "__dict__")
+
+    def test_attribute_free_results_are_shared(self) -> None:
+        assert parse_inline_html("<br>") is parse_inline_html("<br/>")
+        assert parse_inline_html("</span>") is parse_inline_html("</span>")
+
 
 # ── preprocess_notion_html ────────────────────────────────────────────────
 
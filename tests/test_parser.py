@@ -2,13 +2,61 @@
 
 from __future__ import annotations
 
-from notion_markdown._parser import parse
+import pytest
+
+from notion_markdown._parser import (
+    _attr_bool,
+    _attr_int,
+    _attr_str,
+    _convert_block,
+    _convert_block_html,
+    _convert_image_block,
+    _convert_list_item,
+    _convert_paragraph,
+    _convert_table,
+    _pad_row,
+    parse,
+)
+
+
+def _anns(rich_text: list[dict]) -> frozenset[str]:
+    """Return the names of the annotations active anywhere in *rich_text*."""
+    names: set[str] = set()
+    for rt in rich_text:
+        ann = rt.get("annotations")
+        if ann:
+            names.update(name for name, value in ann.items() if value)
+    return frozenset(names)
+
+
+def _descend(block: dict, *indexes: int) -> dict:
+    """Follow ``children[i]`` of each successive block for every *i* in *indexes*."""
+    for i in indexes:
+        block = block[block["type"]]["children"][i]
+    return block
 
 
 def _text(block: dict, key: str | None = None) -> str:
     """Extract the plain-text content from a block's rich_text."""
-    k = key or block["type"]
-    return "".join(rt["text"]["content"] for rt in block[k]["rich_text"] if rt["type"] == "text")
+    rich_text = block[key or block["type"]]["rich_text"]
+    return "".join([rt["text"]["content"] for rt in rich_text if rt["type"] == "text"])
+
+
+# (alias, expected Notion language, fenced code block) for the language-alias test.
+_ALIAS_CASES = tuple(
+    (alias, expected, f"```{alias}\ncode\n```")
+    for alias, expected in {
+        "js": "javascript",
+        "ts": "typescript",
+        "sh": "shell",
+        "yml": "yaml",
+        "rb": "ruby",
+        "rs": "rust",
+        "cpp": "c++",
+        "cs": "c#",
+    }.items()
+)
+_ALIAS_IDS = [alias for alias, _, _ in _ALIAS_CASES]
 
 
 # ── Headings ───────────────────────────────────────────────────────────────
@@ -40,7 +88,7 @@ class TestHeadings:
     def test_heading_with_inline(self) -> None:
         blocks = parse("# Hello **world**")
         rt = blocks[0]["heading_1"]["rich_text"]
-        assert any(it.get("annotations", {}).get("bold") for it in rt)
+        assert "bold" in _anns(rt)
 
     def test_heading_not_toggleable(self) -> None:
         blocks = parse("# Title")
@@ -60,8 +108,7 @@ class TestParagraphs:
     def test_with_formatting(self) -> None:
         blocks = parse("Some **bold** and *italic* text.")
         rt = blocks[0]["paragraph"]["rich_text"]
-        assert any(it.get("annotations", {}).get("bold") for it in rt)
-        assert any(it.get("annotations", {}).get("italic") for it in rt)
+        assert {"bold", "italic"} <= _anns(rt)
 
     def test_multiple_paragraphs(self) -> None:
         blocks = parse("First paragraph.\n\nSecond paragraph.")
@@ -87,23 +134,20 @@ class TestBulletedList:
     def test_nested_list(self) -> None:
         blocks = parse("- parent\n  - child")
         assert len(blocks) == 1
-        parent = blocks[0]
-        children = parent["bulleted_list_item"].get("children", [])
-        assert len(children) == 1
-        assert children[0]["type"] == "bulleted_list_item"
-        assert _text(children[0]) == "child"
+        assert len(blocks[0]["bulleted_list_item"]["children"]) == 1
+        child = _descend(blocks[0], 0)
+        assert child["type"] == "bulleted_list_item"
+        assert _text(child) == "child"
 
     def test_deeply_nested(self) -> None:
         blocks = parse("- a\n  - b\n    - c")
-        child = blocks[0]["bulleted_list_item"]["children"][0]
-        grandchild = child["bulleted_list_item"]["children"][0]
-        assert _text(grandchild) == "c"
+        assert _text(_descend(blocks[0], 0, 0)) == "c"
 
     def test_list_with_formatted_items(self) -> None:
         blocks = parse("- **bold** item\n- `code` item\n- ~~strike~~ item")
         assert len(blocks) == 3
         rt0 = blocks[0]["bulleted_list_item"]["rich_text"]
-        assert any(it.get("annotations", {}).get("bold") for it in rt0)
+        assert "bold" in _anns(rt0)
 
     def test_list_item_with_code_block_child(self) -> None:
         """A list item can contain a code block as a nested child."""
@@ -133,9 +177,8 @@ class TestNumberedList:
 
     def test_nested_ordered(self) -> None:
         blocks = parse("1. outer\n   1. inner")
-        children = blocks[0]["numbered_list_item"].get("children", [])
-        assert len(children) == 1
-        assert children[0]["type"] == "numbered_list_item"
+        assert len(blocks[0]["numbered_list_item"]["children"]) == 1
+        assert _descend(blocks[0], 0)["type"] == "numbered_list_item"
 
 
 # ── To-do / task list ─────────────────────────────────────────────────────
@@ -164,8 +207,7 @@ class TestToDo:
         md = "- [x] parent\n  - sub-item"
         blocks = parse(md)
         assert blocks[0]["type"] == "to_do"
-        children = blocks[0]["to_do"].get("children", [])
-        assert len(children) >= 1
+        assert _text(_descend(blocks[0], 0)) == "sub-item"
 
 
 # ── Code blocks ────────────────────────────────────────────────────────────
@@ -182,20 +224,9 @@ class TestCodeBlock:
         blocks = parse("```\nplain code\n```")
         assert blocks[0]["code"]["language"] == "plain text"
 
-    def test_language_aliases(self) -> None:
-        aliases = {
-            "js": "javascript",
-            "ts": "typescript",
-            "sh": "shell",
-            "yml": "yaml",
-            "rb": "ruby",
-            "rs": "rust",
-            "cpp": "c++",
-            "cs": "c#",
-        }
-        for alias, expected in aliases.items():
-            blocks = parse(f"```{alias}\ncode\n```")
-            assert blocks[0]["code"]["language"] == expected, f"Failed for alias {alias}"
+    @pytest.mark.parametrize(("alias", "expected", "md"), _ALIAS_CASES, ids=_ALIAS_IDS)
+    def test_language_aliases(self, alias, expected, md) -> None:
+        assert parse(md)[0]["code"]["language"] == expected
 
     def test_multiline_code(self) -> None:
         md = "```python\ndef foo():\n    return 42\n```"
@@ -209,17 +240,12 @@ class TestCodeBlock:
 
 
 class TestDivider:
-    def test_triple_dash(self) -> None:
-        blocks = parse("---")
+    @pytest.mark.parametrize("md", ["---", "***", "___"], ids=["dash", "asterisk", "underscore"])
+    def test_thematic_break(self, md) -> None:
+        blocks = parse(md)
         assert blocks[0]["type"] == "divider"
         assert blocks[0]["divider"] == {}
 
-    def test_triple_asterisk(self) -> None:
-        assert parse("***")[0]["type"] == "divider"
-
-    def test_triple_underscore(self) -> None:
-        assert parse("___")[0]["type"] == "divider"
-
 
 # ── Block quotes ───────────────────────────────────────────────────────────
 
@@ -237,7 +263,7 @@ class TestBlockQuote:
     def test_quote_with_formatting(self) -> None:
         blocks = parse("> **bold** quote")
         rt = blocks[0]["quote"]["rich_text"]
-        assert any(it.get("annotations", {}).get("bold") for it in rt)
+        assert "bold" in _anns(rt)
 
     def test_multi_paragraph_quote(self) -> None:
         blocks = parse("> First para\n>\n> Second para")
@@ -276,7 +302,7 @@ class TestTable:
         md = "| Normal | **Bold** |\n|--------|----------|\n| plain  | *italic* |"
         blocks = parse(md)
         header_bold_cell = blocks[0]["table"]["children"][0]["table_row"]["cells"][1]
-        assert any(it.get("annotations", {}).get("bold") for it in header_bold_cell)
+        assert "bold" in _anns(header_bold_cell)
 
     def test_three_column_table(self) -> None:
         md = "| A | B | C |\n|---|---|---|\n| 1 | 2 | 3 |"
@@ -338,8 +364,6 @@ class TestBlockHTML:
 
     def test_empty_html_block_skipped(self) -> None:
         """An empty HTML block produces no output."""
-        from notion_markdown._parser import _convert_block_html
-
         result = _convert_block_html({"type": "block_html", "raw": ""})
         assert result == []
 
@@ -357,7 +381,7 @@ class TestCallout:
     def test_aside_callout_text(self) -> None:
         blocks = parse("<aside>\n💡 Tip: check the docs.\n</aside>")
         text = blocks[0]["callout"]["rich_text"][0]["text"]["content"]
-        assert "Tip: check the docs." in text
+        assert text == "Tip: check the docs."
 
     def test_aside_callout_no_emoji(self) -> None:
         blocks = parse("<aside>Just a note.</aside>")
@@ -402,24 +426,8 @@ class TestToggle:
 # ── Mixed standard markdown + Notion HTML ──────────────────────────────────
 
 
-class TestMixedContent:
-    def test_callout_between_paragraphs(self) -> None:
-        md = "Before.\n\n<aside>\n💡 Note\n</aside>\n\nAfter."
-        blocks = parse(md)
-        types = [b["type"] for b in blocks]
-        assert "paragraph" in types
-        assert "callout" in types
-
-    def test_toggle_after_heading(self) -> None:
-        md = "# Title\n\n<details><summary>FAQ</summary>Answer here</details>"
-        blocks = parse(md)
-        types = [b["type"] for b in blocks]
-        assert "heading_1" in types
-        assert "toggle" in types
-
-    def test_full_notion_export_document(self) -> None:
-        """Test a realistic Notion export with mixed content."""
-        md = """\
+# A realistic Notion export mixing standard Markdown with Notion HTML.
+_NOTION_EXPORT_MD = """\
 # Project Notes
 
 Some **bold** and *italic* text.
@@ -453,18 +461,47 @@ def hello():
 
 format: has ~~strike~~, <span underline="true">under</span>, `code`
 """
+
+
+@pytest.fixture(scope="session")
+def notion_export_types() -> set[str]:
+    """Top-level block types of ``_NOTION_EXPORT_MD``, parsed once per session."""
+    return {b["type"] for b in parse(_NOTION_EXPORT_MD)}
+
+
+class TestMixedContent:
+    def test_callout_between_paragraphs(self) -> None:
+        md = "Before.\n\n<aside>\n💡 Note\n</aside>\n\nAfter."
         blocks = parse(md)
         types = [b["type"] for b in blocks]
-        assert "heading_1" in types
-        assert "heading_2" in types
         assert "paragraph" in types
         assert "callout" in types
-        assert "numbered_list_item" in types
-        assert "to_do" in types
+
+    def test_toggle_after_heading(self) -> None:
+        md = "# Title\n\n<details><summary>FAQ</summary>Answer here</details>"
+        blocks = parse(md)
+        types = [b["type"] for b in blocks]
+        assert "heading_1" in types
         assert "toggle" in types
-        assert "code" in types
-        assert "divider" in types
-        assert "table" in types
+
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            "heading_1",
+            "heading_2",
+            "paragraph",
+            "callout",
+            "numbered_list_item",
+            "to_do",
+            "toggle",
+            "code",
+            "divider",
+            "table",
+        ],
+    )
+    def test_full_notion_export_document(self, notion_export_types, expected) -> None:
+        """Each block type in a realistic Notion export is produced."""
+        assert expected in notion_export_types
 
 
 # ── Edge cases ─────────────────────────────────────────────────────────────
@@ -486,16 +523,10 @@ class TestEdgeCases:
         md = "# Title\n\nParagraph.\n\n- item\n\n```py\ncode\n```\n\n---"
         blocks = parse(md)
         types = [b["type"] for b in blocks]
-        assert "heading_1" in types
-        assert "paragraph" in types
-        assert "bulleted_list_item" in types
-        assert "code" in types
-        assert "divider" in types
+        assert types == ["heading_1", "paragraph", "bulleted_list_item", "code", "divider"]
 
     def test_unknown_block_type_ignored(self) -> None:
         """Unknown token types produce no output."""
-        from notion_markdown._parser import _convert_block
-
         result = _convert_block({"type": "some_unknown_type"})
         assert result == []
 
@@ -523,19 +554,13 @@ class TestEdgeCases:
 
     def test_image_with_no_url(self) -> None:
         """An image token with no URL produces no block."""
-        from notion_markdown._parser import _convert_image_block
-
         result = _convert_image_block({"type": "image", "attrs": {}})
         assert result == []
 
-    def test_non_list_mistune_return(self) -> None:
+    def test_non_list_mistune_return(self, monkeypatch) -> None:
         """If mistune returns a string (non-AST), parse returns []."""
-        from unittest.mock import patch
-
-        with patch("notion_markdown._parser._MD") as mock_md:
-            mock_md.return_value = "<p>html</p>"
-            result = parse("anything")
-            assert result == []
+        monkeypatch.setattr("notion_markdown._parser._MD", lambda _src: "<p>html</p>")
+        assert parse("anything") == []
 
 
 # ── Attr helpers ───────────────────────────────────────────────────────────
@@ -546,16 +571,12 @@ class TestCoverageEdgeCases:
 
     def test_empty_paragraph_skipped(self) -> None:
         """A paragraph with no parseable content produces no block (line 191)."""
-        from notion_markdown._parser import _convert_paragraph
-
         # A paragraph token whose children produce no rich_text
         result = _convert_paragraph({"type": "paragraph", "children": []})
         assert result == []
 
     def test_task_list_item_without_checked_attr(self) -> None:
         """A task_list_item token without a checked attr defaults to False (line 233)."""
-        from notion_markdown._parser import _convert_list_item
-
         tok = {
             "type": "task_list_item",
             "children": [
@@ -569,8 +590,6 @@ class TestCoverageEdgeCases:
 
     def test_tight_list_inline_children(self) -> None:
         """Tight list items have inline tokens directly as children (line 239)."""
-        from notion_markdown._parser import _convert_list_item
-
         tok = {
             "type": "list_item",
             "children": [{"type": "text", "raw": "direct text"}],
@@ -582,8 +601,6 @@ class TestCoverageEdgeCases:
 
     def test_table_rows_padded_to_width(self) -> None:
         """Ragged rows are padded to table_width for Notion API compliance."""
-        from notion_markdown._parser import _pad_row
-
         cells: list[list] = [[{"type": "text", "text": {"content": "A"}}]]
         padded = _pad_row(cells, 3)
         assert len(padded) == 3
@@ -592,15 +609,11 @@ class TestCoverageEdgeCases:
         assert padded[2] == []
 
     def test_pad_row_no_change_when_full(self) -> None:
-        from notion_markdown._parser import _pad_row
-
         cells: list[list] = [[], []]
         assert _pad_row(cells, 2) is cells
 
     def test_table_body_direct_cells(self) -> None:
         """Table body with direct table_cell children instead of table_row (lines 369-378)."""
-        from notion_markdown._parser import _convert_table
-
         tok = {
             "type": "table",
             "children": [
@@ -630,38 +643,29 @@ class TestCoverageEdgeCases:
 
 
 class TestAttrHelpers:
-    def test_attr_str_missing_attrs(self) -> None:
-        from notion_markdown._parser import _attr_str
-
-        assert _attr_str({"type": "x"}, "url") == ""
-
-    def test_attr_str_non_string_value(self) -> None:
-        from notion_markdown._parser import _attr_str
-
-        assert _attr_str({"type": "x", "attrs": {"url": 42}}, "url") == ""
-
-    def test_attr_int_missing_attrs(self) -> None:
-        from notion_markdown._parser import _attr_int
-
-        assert _attr_int({"type": "x"}, "level", 5) == 5
-
-    def test_attr_int_non_int_value(self) -> None:
-        from notion_markdown._parser import _attr_int
-
-        assert _attr_int({"type": "x", "attrs": {"level": "abc"}}, "level", 1) == 1
-
-    def test_attr_bool_missing_attrs(self) -> None:
-        from notion_markdown._parser import _attr_bool
-
-        assert _attr_bool({"type": "x"}, "checked") is None
-
-    def test_attr_bool_missing_key(self) -> None:
-        from notion_markdown._parser import _attr_bool
-
-        assert _attr_bool({"type": "x", "attrs": {"other": True}}, "checked") is None
-
-    def test_attr_bool_present(self) -> None:
-        from notion_markdown._parser import _attr_bool
-
-        assert _attr_bool({"type": "x", "attrs": {"checked": True}}, "checked") is True
-        assert _attr_bool({"type": "x", "attrs": {"checked": False}}, "checked") is False
+    @pytest.mark.parametrize(
+        ("helper", "tok", "args", "expected"),
+        [
+            (_attr_str, {"type": "x"}, ("url",), ""),
+            (_attr_str, {"type": "x", "attrs": {"url": 42}}, ("url",), ""),
+            (_attr_int, {"type": "x"}, ("level", 5), 5),
+            (_attr_int, {"type": "x", "attrs": {"level": "abc"}}, ("level", 1), 1),
+        ],
+        ids=["str_missing_attrs", "str_non_string", "int_missing_attrs", "int_non_int"],
+    )
+    def test_fallback(self, helper, tok, args, expected) -> None:
+        assert helper(tok, *args) == expected
+
+    @pytest.mark.parametrize(
+        ("attrs", "expected"),
+        [
+            (None, None),
+            ({"other": True}, None),
+            ({"checked": True}, True),
+            ({"checked": False}, False),
+        ],
+        ids=["missing_attrs", "missing_key", "true", "false"],
+    )
+    def test_attr_bool(self, attrs, expected) -> None:
+        tok = {"type": "x"} if attrs is None else {"type": "x", "attrs": attrs}
+        assert _attr_bool(tok, "checked") is expected
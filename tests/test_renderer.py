@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from notion_markdown._renderer import render_blocks, to_markdown
 
 
@@ -153,6 +155,12 @@ class TestCode:
         assert "```\n" in result
         assert "some text" in result
 
+    def test_split_plain_content_is_concatenated_verbatim(self):
+        # Long code arrives from the Notion API as several plain rich-text items.
+        rich_text = [_t("a = '**'\n"), _t("b = [x](y)")]
+        blocks = [{"type": "code", "code": {"rich_text": rich_text, "language": "python"}}]
+        assert to_markdown(blocks) == "```python\na = '**'\nb = [x](y)\n```\n"
+
 
 class TestQuote:
     def test_simple(self):
@@ -395,6 +403,15 @@ class TestMixedDocument:
         result = to_markdown(blocks)
         assert result == "- a\n- b\n"
 
+    def test_blank_between_different_list_types_and_repeated_blocks(self):
+        blocks = [
+            {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": [_t("a")]}},
+            {"type": "numbered_list_item", "numbered_list_item": {"rich_text": [_t("b")]}},
+            {"type": "paragraph", "paragraph": {"rich_text": [_t("c")]}},
+            {"type": "paragraph", "paragraph": {"rich_text": [_t("d")]}},
+        ]
+        assert to_markdown(blocks) == "- a\n\n1. b\n\nc\n\nd\n"
+
 
 class TestRenderBlocks:
     def test_indent(self):
@@ -404,6 +421,49 @@ class TestRenderBlocks:
         result = render_blocks(blocks, indent=4)
         assert result.startswith("    indented")
 
+    def test_indent_beyond_cached_prefixes(self):
+        blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [_t("deep")]}},
+        ]
+        assert render_blocks(blocks, indent=40) == " " * 40 + "deep\n"
+
+    def test_nested_children_do_not_recurse(self, monkeypatch):
+        """Children are rendered from render_blocks' own stack, not by re-entering it."""
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("render_blocks was re-entered")
+
+        monkeypatch.setattr("notion_markdown._renderer.render_blocks", _fail)
+        inner = {"type": "quote", "quote": {"rich_text": [_t("q")]}}
+        item = {"type": "to_do", "to_do": {"rich_text": [_t("t")], "children": [inner]}}
+        blocks = [
+            {
+                "type": "bulleted_list_item",
+                "bulleted_list_item": {"rich_text": [_t("b")], "children": [item]},
+            },
+        ]
+        assert render_blocks(blocks) == "- b\n    - [ ] t\n        > q\n"
+
+    def test_nesting_deeper_than_recursion_limit(self):
+        # Lowered so the output (which grows with the square of the depth) stays small.
+        limit = 400
+        depth = limit + 100
+        block = {"type": "bulleted_list_item", "bulleted_list_item": {"rich_text": [_t("last")]}}
+        for i in reversed(range(depth - 1)):
+            block = {
+                "type": "bulleted_list_item",
+                "bulleted_list_item": {"rich_text": [_t(str(i))], "children": [block]},
+            }
+        lines = [" " * (4 * i) + f"- {i}" for i in range(depth - 1)]
+        lines.append(" " * (4 * (depth - 1)) + "- last")
+        saved = sys.getrecursionlimit()
+        sys.setrecursionlimit(limit)
+        try:
+            result = render_blocks([block])
+        finally:
+            sys.setrecursionlimit(saved)
+        assert result == "\n".join(lines) + "\n"
+
 
 class TestQuoteMultiline:
     def test_multiline_rich_text(self):
@@ -414,6 +474,19 @@ class TestQuoteMultiline:
         assert "> line1" in result
         assert "> line2" in result
 
+    def test_every_line_boundary_is_quoted(self):
+        blocks = [{"type": "quote", "quote": {"rich_text": [_t("a\r\nb\u2028c\n")]}}]
+        assert to_markdown(blocks) == "> a\n> b\n> c\n"
+
+    def test_children_without_output(self):
+        blocks = [
+            {
+                "type": "quote",
+                "quote": {"rich_text": [_t("q")], "children": [{"type": "unsupported"}]},
+            },
+        ]
+        assert to_markdown(blocks) == "> q\n"
+
 
 # ── Helper ────────────────────────────────────────────────────────────────
 
@@ -24,6 +24,10 @@ class TestPlainText:
         items = [{"type": "text", "text": {"content": ""}}]
         assert render_rich_text(items) == ""
 
+    def test_empty_annotated_content_has_no_markers(self):
+        items = [{"type": "text", "text": {"content": ""}, "annotations": {"bold": True}}]
+        assert render_rich_text(items) == ""
+
 
 class TestBold:
     def test_bold(self):
@@ -155,6 +159,16 @@ class TestStackedAnnotations:
         ]
         assert render_rich_text(items) == "*~~text~~*"
 
+    def test_bold_italic_strikethrough(self):
+        items = [
+            {
+                "type": "text",
+                "text": {"content": "text"},
+                "annotations": {"bold": True, "italic": True, "strikethrough": True},
+            },
+        ]
+        assert render_rich_text(items) == "***~~text~~***"
+
 
 class TestMixedContent:
     def test_mixed_plain_bold_italic(self):
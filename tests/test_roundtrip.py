@@ -4,7 +4,7 @@ These tests pin the **exact** output of both conversion directions so that
 any future change to ``to_notion()`` or ``to_markdown()`` that breaks symmetry
 is caught immediately.
 
-For each fixture we test three properties:
+For each fixture a single test checks, reusing each intermediate result:
 
 1. **MD → Blocks → MD** (idempotent):
    ``to_markdown(to_notion(canonical_md)) == canonical_md``
@@ -470,50 +470,26 @@ _IDS = [f[0] for f in FIXTURES]
 # ── Tests ─────────────────────────────────────────────────────────────────
 
 
-class TestMarkdownToBlocksToMarkdown:
-    """MD → Blocks → MD produces exactly the canonical Markdown."""
+class TestRoundtrip:
+    """Both directions, both roundtrips and their stability, from one pass per fixture."""
 
     @pytest.mark.parametrize(("name", "canonical_md", "expected_blocks"), FIXTURES, ids=_IDS)
-    def test_md_to_blocks_to_md(self, name, canonical_md, expected_blocks):
-        assert to_markdown(to_notion(canonical_md)) == canonical_md
-
-
-class TestBlocksToMarkdownToBlocks:
-    """Blocks → MD → Blocks produces exactly the original blocks."""
-
-    @pytest.mark.parametrize(("name", "canonical_md", "expected_blocks"), FIXTURES, ids=_IDS)
-    def test_blocks_to_md_to_blocks(self, name, canonical_md, expected_blocks):
-        assert to_notion(to_markdown(expected_blocks)) == expected_blocks
-
-
-class TestToNotionMatchesExpected:
-    """to_notion(canonical_md) produces exactly the expected blocks."""
-
-    @pytest.mark.parametrize(("name", "canonical_md", "expected_blocks"), FIXTURES, ids=_IDS)
-    def test_to_notion_exact(self, name, canonical_md, expected_blocks):
-        assert to_notion(canonical_md) == expected_blocks
-
-
-class TestToMarkdownMatchesExpected:
-    """to_markdown(expected_blocks) produces exactly the canonical Markdown."""
-
-    @pytest.mark.parametrize(("name", "canonical_md", "expected_blocks"), FIXTURES, ids=_IDS)
-    def test_to_markdown_exact(self, name, canonical_md, expected_blocks):
-        assert to_markdown(expected_blocks) == canonical_md
-
-
-class TestDoubleRoundtripStability:
-    """Two full roundtrips produce identical output (no drift)."""
-
-    @pytest.mark.parametrize(("name", "canonical_md", "expected_blocks"), FIXTURES, ids=_IDS)
-    def test_double_roundtrip(self, name, canonical_md, expected_blocks):
-        # First roundtrip
+    def test_roundtrip(self, name, canonical_md, expected_blocks):
+        # to_notion(canonical_md) produces exactly the expected blocks, and
+        # to_markdown(expected_blocks) exactly the canonical Markdown.
         blocks_1 = to_notion(canonical_md)
-        md_1 = to_markdown(blocks_1)
+        assert blocks_1 == expected_blocks
+        md_1 = to_markdown(expected_blocks)
+        assert md_1 == canonical_md
+
+        # MD → Blocks → MD reproduces the canonical Markdown.
+        md_2 = to_markdown(blocks_1)
+        assert md_2 == canonical_md
 
-        # Second roundtrip
-        blocks_2 = to_notion(md_1)
-        md_2 = to_markdown(blocks_2)
+        # Blocks → MD → Blocks reproduces the expected blocks; a second,
+        # independent to_notion() call would expose state leaking between runs.
+        blocks_2 = to_notion(md_2)
+        assert blocks_2 == expected_blocks
 
-        assert md_1 == md_2
-        assert blocks_1 == blocks_2
+        # A second roundtrip produces the same Markdown (no drift).
+        assert to_markdown(blocks_2) == md_2